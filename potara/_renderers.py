@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# ruff: noqa: E501
+
+"""
+Generated by scripts/compile_templates.py. Do not edit by hand.
+
+Plain Python renderers for the Jinja2 templates that only substitute values.
+"""
+
+
+def render_README_md(ctx):
+    """Render README.md.j2."""
+    return "".join(
+        (
+            "# ",
+            str(ctx["project_name"]),
+            "\n",
+            "\n",
+            str(ctx["description"]),
+            "\n",
+            "\n",
+            "## Installation\n",
+            "\n",
+            "```bash\n",
+            "pip install -r requirements.txt```\n",
+            "\n",
+            "## Usage\n",
+            "\n",
+            "```bash\n",
+            "python -m src.",
+            str(ctx["project_name"]),
+            "```\n",
+            "\n",
+            "## License\n",
+            "\n",
+            "This project is licensed uder the ",
+            str(ctx["license"]),
+            " License - see the LICENSE file for details.",
+        )
+    )
+
+
+def render_Makefile(ctx):
+    """Render Makefile.j2."""
+    return "".join(
+        (
+            "# Makefile\n",
+            "\n",
+            ".PHONY: help install test lint format clean\n",
+            "\n",
+            "help:\n",
+            "\t@echo \"",
+            str(ctx["project_name"]),
+            " - ",
+            str(ctx["description"]),
+            "\"\n",
+            "\t@echo \"Available commands:\"\n",
+            "\t@echo \"  install    Install project dependencies\"\n",
+            "\t@echo \"  test       Run tests\"\n",
+            "\t@echo \"  lint       Lint the codebase\"\n",
+            "\t@echo \"  format     Format the codebase\"\n",
+            "\t@echo \"  clean      Clean build and cache files\"\n",
+            "\n",
+            "install:\n",
+            "\tpoetry install\n",
+            "\n",
+            "test:\n",
+            "\tpoetry run pytest\n",
+            "\n",
+            "lint:\n",
+            "\tpoetry run ruff .\n",
+            "\n",
+            "format:\n",
+            "\tpoetry run ruff . --fix\n",
+            "\n",
+            "clean:\n",
+            "\trm -rf __pycache__/\n",
+            "\trm -rf build/\n",
+            "\trm -rf dist/\n",
+            "\trm -rf *.egg-info/\n",
+            "\trm -rf .coverage\n",
+        )
+    )
+
+
+def render_LICENSE(ctx):
+    """Render LICENSE.j2."""
+    return "".join(
+        (
+            "MIT License\n",
+            "\n",
+            "Copyright (c) ",
+            str(ctx["year"]),
+            " ",
+            str(ctx["author"]),
+            "\n",
+            "\n",
+            "Permission is hereby granted, free of charge, to any person obtaining a copy\n",
+            "of this software and associated documentation files (the \"Software\"), to deal\n",
+            "in the Software without restriction, including without limitation the rights\n",
+            "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n",
+            "copies of the Software, and to permit persons to whom the Software is\n",
+            "furnished to do so, subject to the following conditions:\n",
+            "\n",
+            "The above copyright notice and this permission notice shall be included in all\n",
+            "copies or substantial portions of the Software.\n",
+            "\n",
+            "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n",
+            "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n",
+            "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n",
+            "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n",
+            "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n",
+            "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n",
+            "SOFTWARE.\n",
+        )
+    )
+
+
+def render_pyproject_toml(ctx):
+    """Render pyproject.toml.j2."""
+    return "".join(
+        (
+            "[tool.poetry]\n",
+            "name = \"",
+            str(ctx["project_name_toml"]),
+            "\"\n",
+            "version = \"0.1.0\"\n",
+            "description = \"",
+            str(ctx["description_toml"]),
+            "\"\n",
+            "authors = [\"",
+            str(ctx["author_toml"]),
+            " <",
+            str(ctx["email_toml"]),
+            ">\"]\n",
+            "readme = \"README.md\"\n",
+            "license = \"",
+            str(ctx["license_toml"]),
+            "\"\n",
+            "packages = [{ include = \"",
+            str(ctx["project_name_toml"]),
+            "\", from = \"src\" }]\n",
+            "\n",
+            "[tool.poetry.dependencies]\n",
+            "python = \"^3.11\"\n",
+            "\n",
+            "[tool.poetry.group.dev.dependencies]\n",
+            "pytest = \"^8.3.3\"\n",
+            "ruff = \"^0.6.9\"\n",
+            "\n",
+            "[build-system]\n",
+            "requires = [\"poetry-core\"]\n",
+            "build-backend = \"poetry.core.masonry.api\"\n",
+        )
+    )
+
+
+def render_test_project_py(ctx):
+    """Render test_project.py.j2."""
+    return "".join(
+        (
+            "import unittest\n",
+            "\n",
+            "class Test",
+            str(ctx["project_name"]).capitalize(),
+            "(unittest.TestCase):\n",
+            "    def test_example(self):\n",
+            "        self.assertEqual(1, 1)\n",
+            "\n",
+            "if __name__ == '__main__':\n",
+            "    unittest.main()\n",
+        )
+    )
+
+
+# Template name -> (sha256 of its source, renderer)
+RENDERERS = {
+    "README.md.j2": (
+        "ae38f52eda0444acce553c9814d8b547f9882a3f6a8e56a777bcdbf153c56fda",
+        render_README_md,
+    ),
+    "Makefile.j2": (
+        "3db606aabfb85123a850344f84624a553ef0727ce58a3a63ca93facfb190d905",
+        render_Makefile,
+    ),
+    "LICENSE.j2": (
+        "786ff4f46403d146e9cd16256b94c2fd0e73eee4cb5d0c4e576e64770b704078",
+        render_LICENSE,
+    ),
+    "pyproject.toml.j2": (
+        "1d8f27a5b9f0d628fa91a2cc06454529714878dab2c8fccf29e7f69b76767332",
+        render_pyproject_toml,
+    ),
+    "test_project.py.j2": (
+        "ca131a301c305e1bb4be69e1c3746597aa54e3a2d60b67441e1055b8edff1bf9",
+        render_test_project_py,
+    ),
+}
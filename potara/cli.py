@@ -8,7 +8,8 @@ This script creates a new Python project with the specified configurations.
 
 Description:
 - Creates a new project directory with the specified name.
-- Renders template files (e.g., README.md, LICENSE) using Jinja2 templates.
+- Renders template files (e.g., README.md, LICENSE, pyproject.toml) using
+  Jinja2 templates.
 - Optionally initializes a virtual environment and installs dependencies.
 - Optionally initializes a Git repository and makes the initial commit.
 - Optionally sets up CI/CD configurations using GitHub Actions and Dependabot.
@@ -25,7 +26,8 @@ Options:
 - --venv: If provided, creates a virtual environment in the project directory.
 - --git: If provided, initializes a Git repository in the project directory.
 - --ci: If provided, sets up GitHub Actions workflow and Dependabot configuration.
-- --interactive: If provided, runs 'poetry init' interactively.
+- --interactive: If provided, runs 'poetry init' interactively instead of
+  rendering pyproject.toml from a template.
 
 Usage:
 - Run the script with the required arguments and options.
@@ -42,27 +44,206 @@ __version__ = "0.1.0"
 __date__ = "2024-10-08"
 __license__ = "MIT"
 
+import hashlib
+import json
 import os
+import shutil
 import subprocess
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from pathlib import Path
+from venv import EnvBuilder
 
 import typer
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-# Initialize Jinja2 environment
-env = Environment(
-    loader=FileSystemLoader(
-        os.path.join(os.path.dirname(__file__), "..", "templates")
-    ),
-    autoescape=select_autoescape(["html", "xml"]),
+# Directory holding the project templates
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+# Persist compiled template bytecode between runs
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache")),
+    "potara",
+    "jinja",
 )
 
+# Templates rendered into every new project, with their output paths relative
+# to the project directory. Jinja2 handles the ".j2" files; ".tmpl" files only
+# need simple substitutions and use str.format_map. Output paths are built once
+# here and only have {project_name} filled in per run. Unlike Jinja2, which
+# strips a single trailing newline, ".tmpl" output keeps the file's final
+# newline.
+TEMPLATE_ITEMS = (
+    ("README.md.j2", "README.md"),
+    (".gitignore.tmpl", ".gitignore"),
+    ("Makefile.j2", "Makefile"),
+    ("LICENSE.j2", "LICENSE"),
+    ("pyproject.toml.j2", "pyproject.toml"),
+    ("requirements.txt.tmpl", "requirements.txt"),
+    ("test_project.py.j2", os.path.join("tests", "test_{project_name}.py")),
+    ("src_init.py.tmpl", os.path.join("src", "{project_name}", "__init__.py")),
+    ("ci.yml.j2", os.path.join(".github", "workflows", "ci.yml")),
+    ("dependabot.yml.tmpl", os.path.join(".github", "dependabot.yml")),
+)
+
+# Subdirectories needed by the output paths, parents first
+OUTPUT_DIRS = tuple(
+    sorted(
+        {os.path.dirname(output_file) for _, output_file in TEMPLATE_ITEMS} - {""},
+        key=len,
+    )
+)
+
+# Loaded templates, sorted by how they render on first use. Templates with
+# nothing to substitute are copied verbatim from their path in _STATIC, and
+# Jinja2 templates with a generated renderer in potara/_renderers.py (see
+# scripts/compile_templates.py) skip Jinja2 entirely.
+_loaded = False
+_STATIC = {}
+_RENDERERS = {}
+_COMPILED = {}
+_RAW = {}
+
+
+def _create_env(sources):
+    """Build a Jinja2 environment for the given sources, importing Jinja2."""
+    from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+
+    # The cache is optional, so skip it if the directory is not writable
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if not os.access(CACHE_DIR, os.W_OK):
+            raise PermissionError(CACHE_DIR)
+        bytecode_cache = FileSystemBytecodeCache(CACHE_DIR)
+    except OSError:
+        bytecode_cache = None
+
+    return Environment(
+        # Serve the already-read sources so lookups never touch the disk
+        loader=DictLoader(sources),
+        # None of the templates produce HTML or XML
+        autoescape=False,
+        auto_reload=False,
+        cache_size=len(sources),
+        bytecode_cache=bytecode_cache,
+    )
+
+
+def _toml_escape(value):
+    """Escape a value for use inside a TOML basic (double-quoted) string."""
+    # JSON string escapes are a subset of TOML basic string escapes
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
+def _is_current(entry, source):
+    """Check that a generated renderer was built from this template source."""
+    if entry is None:
+        return False
+    return entry[0] == hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _load_templates():
+    """Sort every template by how it is rendered, reading each once."""
+    global _loaded
+    if _loaded:
+        return
+    from potara._renderers import RENDERERS
 
-def render_template(template_name, **context):
-    """Render a template with the given context."""
-    template = env.get_template(template_name)
-    return template.render(**context)
+    sources = {}
+    for name, _ in TEMPLATE_ITEMS:
+        path = TEMPLATES_DIR / name
+        source = path.read_text(encoding="utf-8")
+        if name.endswith(".tmpl"):
+            is_static = "{" not in source and "}" not in source
+        else:
+            is_static = not any(tag in source for tag in ("{{", "{%", "{#"))
+
+        if is_static:
+            _STATIC[name] = path
+        elif name.endswith(".tmpl"):
+            _RAW[name] = source
+        elif _is_current(RENDERERS.get(name), source):
+            _RENDERERS[name] = RENDERERS[name][1]
+        else:
+            sources[name] = source
+
+    if sources:
+        env = _create_env(sources)
+        _COMPILED.update({name: env.get_template(name) for name in sources})
+    _loaded = True
+
+
+def render_and_write(template_file, output_path, context):
+    """Render a template and write it to the given path."""
+    if template_file in _STATIC:
+        # Nothing to substitute, so let the OS copy the file directly. The
+        # copy is byte-for-byte, so unlike Jinja2 it keeps the final newline
+        shutil.copyfile(_STATIC[template_file], output_path)
+        return output_path
+
+    if template_file in _RENDERERS:
+        rendered_content = _RENDERERS[template_file](context)
+    elif template_file.endswith(".tmpl"):
+        rendered_content = _RAW[template_file].format_map(context)
+    else:
+        rendered_content = _COMPILED[template_file].render(context)
+    # Encode once and write the bytes in a single call
+    with open(output_path, "wb") as f:
+        f.write(rendered_content.encode("utf-8"))
+    return output_path
+
+
+def create_venv(project_dir):
+    """Create a virtual environment and install the project dependencies."""
+    venv_path = os.path.join(project_dir, "venv")
+    typer.echo("Creating virtual environment...")
+    # Build the venv in-process rather than spawning 'python -m venv';
+    # symlink the interpreter on POSIX instead of copying it
+    EnvBuilder(
+        with_pip=True, upgrade_deps=True, symlinks=(os.name != "nt")
+    ).create(venv_path)
+    typer.echo(f"Created virtual environment at '{venv_path}'")
+
+    if os.name != "nt":
+        pip_executable = os.path.join(venv_path, "bin", "pip")
+    else:
+        pip_executable = os.path.join(
+            venv_path, "Scripts", "pip.exe"
+        )
+
+    # pip was already upgraded by EnvBuilder(upgrade_deps=True)
+    subprocess.run(
+        [
+            pip_executable,
+            "install",
+            "-r",
+            os.path.join(project_dir, "requirements.txt"),
+        ],
+        check=True,
+    )
+    typer.echo("Installed project dependencies.")
+
+
+def init_git(project_dir):
+    """Initialize a Git repository and make the initial commit."""
+    try:
+        subprocess.run(
+            ["git", "init", "-q", "--initial-branch=main"],
+            cwd=project_dir,
+            check=True,
+        )
+        subprocess.run(
+            ["git", "add", "-A"], cwd=project_dir, check=True
+        )
+        subprocess.run(
+            ["git", "commit", "-q", "--no-verify", "-m", "Initial commit"],
+            cwd=project_dir,
+            check=True,
+        )
+        typer.echo(
+            "Initialized Git repository and made the initial commit."
+        )
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"Git initialization failed: {e}")
 
 
 class LicenseType(str, Enum):
@@ -71,6 +252,23 @@ class LicenseType(str, Enum):
     GPL = "GPL-3.0"
 
 
+# License values looked up once rather than on every run
+_LICENSE_VALUES = {license_type: license_type.value for license_type in LicenseType}
+
+# Current year for the templates, computed once per process
+_year = None
+
+
+def _current_year():
+    """Return the current year, importing datetime on first use."""
+    global _year
+    if _year is None:
+        from datetime import date
+
+        _year = date.today().year
+    return _year
+
+
 app = typer.Typer()
 
 
@@ -109,8 +307,15 @@ def cli(
     # Define the project directory path
     project_dir = os.path.abspath(project_name)
 
-    # Check if the project directory already exists
-    if os.path.exists(project_dir):
+    # Check if the project directory already exists (a single lstat call,
+    # made before any template loading so this error path stays cheap)
+    try:
+        os.lstat(project_dir)
+        exists = True
+    except FileNotFoundError:
+        exists = False
+
+    if exists:
         typer.echo(f"Error: Directory '{project_dir}' already exists.")
         raise typer.Exit(code=1)
 
@@ -124,114 +329,77 @@ def cli(
         "description": description,
         "author": author,
         "email": email,
-        "license": license.value,
-        "year": datetime.now().year,
+        "license": _LICENSE_VALUES[license],
+        "year": _current_year(),
     }
 
-    # List of templates
-    templates = {
-        "README.md.j2": "README.md",
-        ".gitignore.j2": ".gitignore",
-        "Makefile.j2": "Makefile",
-        "LICENSE.j2": "LICENSE",
-        "requirements.txt.j2": "requirements.txt",
-        "test_project.py.j2": os.path.join("tests", f"test_{project_name}.py"),
-        "src_init.py.j2": os.path.join("src", project_name, "__init__.py"),
-        "ci.yml.j2": os.path.join(".github", "workflows", "ci.yml"),
-        "dependabot.yml.j2": os.path.join(".github", "dependabot.yml"),
-    }
+    # TOML-safe copies of the values written into pyproject.toml
+    context.update(
+        {
+            f"{key}_toml": _toml_escape(context[key])
+            for key in ("project_name", "description", "author", "email", "license")
+        }
+    )
 
-    # Create subdirectories before rendering templates
-    subdirs = [
-        os.path.join(project_dir, "src", project_name),
-        os.path.join(project_dir, "tests"),
-        os.path.join(project_dir, ".github", "workflows"),
-    ]
+    # Output path for each template. 'poetry init' writes pyproject.toml
+    # itself when running interactively.
+    sep = os.sep
+    templates = {}
+    for template_file, output_file in TEMPLATE_ITEMS:
+        if interactive and template_file == "pyproject.toml.j2":
+            continue
+        templates[template_file] = (
+            project_dir + sep + output_file.format(project_name=project_name)
+        )
 
-    for subdir in subdirs:
+    # Create each subdirectory once before rendering templates
+    for output_dir in OUTPUT_DIRS:
+        subdir = project_dir + sep + output_dir.format(project_name=project_name)
         os.makedirs(subdir, exist_ok=True)
         typer.echo(f"Created directory: {subdir}")
 
-    # Render and write template files
-    for template_file, output_file in templates.items():
-        rendered_content = render_template(template_file, **context)
-        output_path = os.path.join(project_dir, output_file)
-
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-        with open(output_path, "w") as f:
-            f.write(rendered_content)
-        typer.echo(f"Created file: {output_path}")
+    # Render and write template files, overlapping rendering with file I/O
+    _load_templates()
+    output_paths = templates.values()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for output_path in executor.map(
+            render_and_write, templates, output_paths, [context] * len(templates)
+        ):
+            typer.echo(f"Created file: {output_path}")
 
     # Poetry Init
-    poetry_init_cmd = ["poetry", "init"]
-    if not interactive:
-        poetry_init_cmd.append("--no-interaction")
-
-    typer.echo("Initializing Poetry...")
-    try:
-        subprocess.run(poetry_init_cmd, cwd=project_dir, check=True)
-        typer.echo("Poetry initialization completed.")
-    except subprocess.CalledProcessError as e:
-        typer.echo(f"Error during Poetry initialization: {e}")
-        raise typer.Exit(code=1)
+    if interactive:
+        typer.echo("Initializing Poetry...")
+        try:
+            subprocess.run(["poetry", "init"], cwd=project_dir, check=True)
+            typer.echo("Poetry initialization completed.")
+        except subprocess.CalledProcessError as e:
+            typer.echo(f"Error during Poetry initialization: {e}")
+            raise typer.Exit(code=1)
 
     # Optionally set up CI/CD configurations
     if ci:
         typer.echo("CI/CD configurations already set up via templates.")
 
-    # Optionally create a virtual environment and install dependencies
-    if venv:
-        venv_path = os.path.join(project_dir, "venv")
-        typer.echo("Creating virtual environment...")
-        subprocess.run(
-            [os.sys.executable, "-m", "venv", venv_path],
-            check=True,
-        )
-        typer.echo(f"Created virtual environment at '{venv_path}'")
-
-        if os.name != "nt":
-            pip_executable = os.path.join(venv_path, "bin", "pip")
-        else:
-            pip_executable = os.path.join(
-                venv_path, "Scripts", "pip.exe"
-            )
-
-        # Upgrade pip and install dependencies
-        subprocess.run(
-            [pip_executable, "install", "--upgrade", "pip"],
-            check=True,
-        )
-        subprocess.run(
-            [
-                pip_executable,
-                "install",
-                "-r",
-                os.path.join(project_dir, "requirements.txt"),
-            ],
-            check=True,
-        )
-        typer.echo("Installed project dependencies.")
-
-    # Git Init
-    if git:
-        try:
-            subprocess.run(
-                ["git", "init"], cwd=project_dir, check=True
-            )
-            subprocess.run(
-                ["git", "add", "."], cwd=project_dir, check=True
-            )
-            subprocess.run(
-                ["git", "commit", "-m", "Initial commit"],
-                cwd=project_dir,
-                check=True,
-            )
-            typer.echo(
-                "Initialized Git repository and made the initial commit."
-            )
-        except subprocess.CalledProcessError as e:
-            typer.echo(f"Git initialization failed: {e}")
+    # Venv setup and Git init are independent, so run them side by side
+    if venv or git:
+        venv_future = git_future = None
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if venv:
+                venv_future = executor.submit(create_venv, project_dir)
+            if git:
+                git_future = executor.submit(init_git, project_dir)
+
+        if venv_future is not None:
+            try:
+                venv_future.result()
+            except subprocess.CalledProcessError as e:
+                typer.echo(f"Error during virtual environment setup: {e}")
+                raise typer.Exit(code=1)
+
+        # init_git reports its own failures; re-raise anything unexpected
+        if git_future is not None:
+            git_future.result()
 
     typer.echo(
         f"\nProject '{project_name}' has been initialized!"
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compile Potara's Jinja2 templates into plain Python render functions.
+
+Description:
+- Parses each ".j2" template in TEMPLATE_ITEMS with Jinja2.
+- Templates made only of literal text, variables and the 'capitalize' filter
+  are turned into a function that joins the literals and context values.
+- Templates using anything else (e.g., {% if %} or {% for %}) are skipped and
+  keep rendering through Jinja2 at runtime.
+- Writes the functions, with a hash of each template source, to
+  potara/_renderers.py. At runtime a renderer is only used while its hash
+  still matches the template on disk.
+
+Usage:
+- Run after changing any ".j2" template: make templates
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+from jinja2 import Environment, nodes
+
+# Make the potara package importable without installing it first
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from potara.cli import TEMPLATE_ITEMS, TEMPLATES_DIR  # noqa: E402
+
+OUTPUT_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "potara", "_renderers.py"
+)
+
+HEADER = '''# -*- coding: utf-8 -*-
+# ruff: noqa: E501
+
+"""
+Generated by scripts/compile_templates.py. Do not edit by hand.
+
+Plain Python renderers for the Jinja2 templates that only substitute values.
+"""
+'''
+
+
+def expressions(node):
+    """Return Python source for an output node's parts, or None if unsupported."""
+    if isinstance(node, nodes.TemplateData):
+        return [json.dumps(line) for line in node.data.splitlines(keepends=True)]
+    if isinstance(node, nodes.Name):
+        return [f"str(ctx[{json.dumps(node.name)}])"]
+    if (
+        isinstance(node, nodes.Filter)
+        and node.name == "capitalize"
+        and isinstance(node.node, nodes.Name)
+        and not (node.args or node.kwargs or node.dyn_args or node.dyn_kwargs)
+    ):
+        return [f"str(ctx[{json.dumps(node.node.name)}]).capitalize()"]
+    return None
+
+
+def compile_template(env, source):
+    """Return the parts of a simple template, or None if it needs Jinja2."""
+    parts = []
+    for statement in env.parse(source).body:
+        if not isinstance(statement, nodes.Output):
+            return None
+        for node in statement.nodes:
+            node_parts = expressions(node)
+            if node_parts is None:
+                return None
+            parts.extend(node_parts)
+    return parts
+
+
+def function_name(template_name):
+    """Turn a template name like 'README.md.j2' into 'render_README_md'."""
+    stem = template_name.removesuffix(".j2")
+    return "render_" + re.sub(r"\W", "_", stem)
+
+
+def main():
+    """Write potara/_renderers.py from the current templates."""
+    env = Environment()
+    functions = []
+    entries = []
+
+    for name, _ in TEMPLATE_ITEMS:
+        if not name.endswith(".j2"):
+            continue
+        source = (TEMPLATES_DIR / name).read_text(encoding="utf-8")
+        if not any(tag in source for tag in ("{{", "{%", "{#")):
+            # Static templates are copied verbatim at runtime
+            continue
+        parts = compile_template(env, source)
+        if parts is None:
+            print(f"Skipped {name}: needs Jinja2")
+            continue
+
+        func = function_name(name)
+        body = "".join(f"            {part},\n" for part in parts)
+        functions.append(
+            f"\n\ndef {func}(ctx):\n"
+            f'    """Render {name}."""\n'
+            f'    return "".join(\n'
+            f"        (\n{body}        )\n"
+            f"    )\n"
+        )
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        entries.append(f"    {json.dumps(name)}: (\n        {json.dumps(digest)},\n")
+        entries.append(f"        {func},\n    ),\n")
+        print(f"Compiled {name}")
+
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        f.writelines(functions)
+        f.write(
+            "\n\n# Template name -> (sha256 of its source, renderer)\n"
+            "RENDERERS = {\n"
+        )
+        f.writelines(entries)
+        f.write("}\n")
+    print(f"Wrote {os.path.abspath(OUTPUT_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
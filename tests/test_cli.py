@@ -1,5 +1,7 @@
+import importlib.util
 import os
 import tempfile
+import tomllib
 
 from typer.testing import CliRunner
 
@@ -44,3 +46,71 @@ def test_init():
             os.path.join(project_name, '.github', 'workflows', 'ci.yml')
         )
         assert os.path.exists(os.path.join(project_name, '.github', 'dependabot.yml'))
+
+
+def test_pyproject_is_valid_toml():
+    runner = CliRunner()
+    project_name = 'toml_project'
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        os.chdir(tmpdirname)
+
+        result = runner.invoke(app, [
+            project_name,
+            '--description', 'A "fast" tool',
+            '--author', 'Back\\slash',
+        ])
+
+        assert result.exit_code == 0
+        with open(os.path.join(project_name, 'pyproject.toml'), 'rb') as f:
+            pyproject = tomllib.load(f)
+
+        poetry = pyproject['tool']['poetry']
+        assert poetry['name'] == project_name
+        assert poetry['description'] == 'A "fast" tool'
+        assert poetry['authors'] == ['Back\\slash <you@example.com>']
+
+
+def test_renderers_up_to_date():
+    from jinja2 import Environment
+
+    from potara import cli
+
+    script = os.path.join(
+        os.path.dirname(__file__), '..', 'scripts', 'compile_templates.py'
+    )
+    spec = importlib.util.spec_from_file_location('compile_templates', script)
+    compile_templates = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(compile_templates)
+
+    cli._load_templates()
+
+    # Only templates the script cannot compile may fall back to Jinja2; any
+    # other template here has a stale or missing renderer, so run
+    # 'make templates' after editing it
+    env = Environment()
+    for name in cli._COMPILED:
+        source = (cli.TEMPLATES_DIR / name).read_text(encoding='utf-8')
+        assert compile_templates.compile_template(env, source) is None, name
+
+
+def test_renderers_match_jinja():
+    from jinja2 import Environment, FileSystemLoader
+
+    from potara import cli
+    from potara._renderers import RENDERERS
+
+    env = Environment(loader=FileSystemLoader(str(cli.TEMPLATES_DIR)))
+    context = {
+        'project_name': 'demo',
+        'description': 'A "quoted" {braced} description\n',
+        'author': 'Test Author',
+        'email': 'test@example.com',
+        'license': 'MIT',
+        'year': 2024,
+    }
+    for key in ('project_name', 'description', 'author', 'email', 'license'):
+        context[f'{key}_toml'] = cli._toml_escape(context[key])
+
+    for name, (_, renderer) in RENDERERS.items():
+        assert renderer(context) == env.get_template(name).render(context), name